@@ -24,36 +24,166 @@ Usage (Server - optional):
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from copy import deepcopy
+from dataclasses import dataclass, field
 from hashlib import sha256
-from time import time
-from typing import List, Optional, Any
+from itertools import count
+from math import isfinite
+from time import time_ns
+from typing import List, Optional, Any, Tuple, Iterator, Union
 import argparse
 import json
+import multiprocessing
 import os
+import sys
+
+try:
+    import orjson  # optional, faster serialization for the store and HTTP responses
+except ImportError:
+    orjson = None
 
 # -----------------------
 # Block structure
 # -----------------------
-@dataclass
+# Hashed layout of a block: compact json.dumps(..., sort_keys=True) of every field but
+# 'hash', split around the nonce. Kept as templates so no dict is built per hash.
+_HEAD_TEMPLATE = b'{"data":%s,"index":%d,"nonce":'
+_TAIL_TEMPLATE = b',"previous_hash":"%s","timestamp":%s}'
+_BLOCK_TEMPLATE = _HEAD_TEMPLATE + b"%d" + _TAIL_TEMPLATE
+_HASH_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
+
+def _json_bytes(value: Any) -> bytes:
+    if type(value) is int:
+        return b"%d" % value
+    if type(value) is float and isfinite(value):
+        # What the encoder emits for finite floats, minus its slow generic path.
+        return repr(value).encode("ascii")
+    return _HASH_ENCODER.encode(value).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if obj holds NaN or +-Infinity anywhere (orjson would write those as null)."""
+    if type(obj) is float:
+        return not isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes for storage/transport (never used for hashing)."""
+    if orjson is not None and not _has_non_finite(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Slotted blocks have no per-instance __dict__: smaller objects, faster field access.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Block:
     index: int
-    timestamp: float
+    timestamp: int  # nanoseconds since the epoch (chains from older versions hold float seconds)
     data: Any
-    previous_hash: str
+    previous_hash: bytes  # raw 32-byte digests in memory; hex in JSON and in the hashed form
     nonce: int = 0
-    hash: str = ""
-
-    def compute_hash(self) -> str:
-        """Compute SHA-256 hash of the block contents (excluding the 'hash' field)."""
-        block_string = json.dumps({
+    hash: bytes = b""
+    # Serialized form, filled by seal() once the block is final.
+    _cached_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        """Return the block as a plain dict; container data is deep-copied, so callers may mutate it."""
+        d = self._json_fields()
+        if isinstance(self.data, (dict, list)):
+            d["data"] = deepcopy(self.data)
+        return d
+
+    def _json_fields(self) -> dict:
+        """Fields as JSON values for serializing; shares data with the block, so never mutate it."""
+        return {
             "index": self.index,
             "timestamp": self.timestamp,
             "data": self.data,
-            "previous_hash": self.previous_hash,
+            "previous_hash": self.previous_hash.hex(),
             "nonce": self.nonce,
-        }, separators=(",", ":"), sort_keys=True)
-        return sha256(block_string.encode("utf-8")).hexdigest()
+            "hash": self.hash.hex(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> Block:
+        """Inverse of to_dict()."""
+        return cls(
+            index=d["index"],
+            timestamp=d["timestamp"],
+            data=d["data"],
+            previous_hash=bytes.fromhex(d["previous_hash"]),
+            nonce=d["nonce"],
+            hash=bytes.fromhex(d["hash"]),
+        )
+
+    def seal(self) -> None:
+        """Mark the block as final and cache its JSON for the store and HTTP responses."""
+        # Copy into a right-sized object: orjson's result keeps its ~1 KiB working buffer.
+        self._cached_json = bytes(memoryview(_dumps(self._json_fields())))
+
+    def to_json(self) -> bytes:
+        """Compact JSON of the block; served from the cache once the block is sealed."""
+        if self._cached_json is None:
+            return _dumps(self._json_fields())
+        return self._cached_json
+
+    def compute_hash(self) -> str:
+        """Compute SHA-256 hash of the block contents (excluding the 'hash' field)."""
+        return self.compute_hash_bytes().hex()
+
+    def compute_hash_bytes(self) -> bytes:
+        """Raw 32-byte digest behind compute_hash(), for comparisons that need no hex."""
+        return sha256(_BLOCK_TEMPLATE % (
+            _json_bytes(self.data), self.index, self.nonce,
+            self.previous_hash.hex().encode("ascii"), _json_bytes(self.timestamp),
+        )).digest()
+
+    def _hash_parts(self) -> Tuple[bytes, bytes]:
+        """
+        Split the hashed serialization around the nonce value, so that
+        sha256(head + str(nonce) + tail) equals compute_hash() for any nonce.
+        """
+        head = _HEAD_TEMPLATE % (_json_bytes(self.data), self.index)
+        tail = _TAIL_TEMPLATE % (self.previous_hash.hex().encode("ascii"), _json_bytes(self.timestamp))
+        return head, tail
+
+
+# -----------------------
+# Proof-of-Work
+# -----------------------
+# Nonces tried per find_nonce() call; big enough to amortize the per-call setup.
+MINE_BATCH = 1 << 16
+
+
+def find_nonce(head: bytes, tail: bytes, start: int, stop: int,
+               max_digest: bytes) -> Optional[Tuple[int, bytes]]:
+    """
+    Search nonces in [start, stop) for the first digest <= max_digest (32 bytes; bytes
+    compare big-endian, so this is an integer comparison done by memcmp). Return
+    (nonce, digest), or None if the batch has no solution. head/tail come from
+    Block._hash_parts().
+    """
+    # head never changes: absorb it once and clone the hasher state per nonce.
+    head_hasher = sha256(head)
+    for nonce in range(start, stop):
+        h = head_hasher.copy()
+        h.update(b"%d%s" % (nonce, tail))
+        digest = h.digest()
+        if digest <= max_digest:
+            return nonce, digest
+    return None
 
 
 # -----------------------
@@ -64,13 +194,28 @@ class CentralBlockchain:
     Centralized manager of the blockchain (single authority).
     Holds the canonical chain in-memory and optionally on-disk.
     """
-    def __init__(self, difficulty: int = 3, persist_path: Optional[str] = "chain.json"):
+    def __init__(self, difficulty: int = 3, persist_path: Optional[str] = "chain.jsonl",
+                 workers: int = 1):
         self.difficulty = int(difficulty)
+        # Processes used by mineBlock; 0 means one per CPU.
+        workers = int(workers)
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None  # mining pool, started on first use and reused for every block
+        # Unused by mining/validation (they compare against the target); kept for callers
+        # of the old string-prefix API.
         self.prefix = "0" * self.difficulty
+        # Difficulty counts leading zero hex digits, i.e. 4 zero bits each, so a digest
+        # meets it exactly when its integer value is below 2 ** (256 - 4 * difficulty).
+        # Difficulty is clamped to 0..64 digits: <= 0 accepts every digest, and above 64
+        # only the all-zero digest qualifies (a SHA-256 has just 64 hex digits).
+        self.target = 1 << (256 - 4 * min(max(self.difficulty, 0), 64))
+        self._max_digest = (self.target - 1).to_bytes(32, "big")
         self.persist_path = persist_path
         self.chain: List[Block] = []
 
-        if self.persist_path and os.path.exists(self.persist_path):
+        if self.persist_path:
             self._load()
         if not self.chain:
             self.chain.append(self._create_genesis_block())
@@ -78,23 +223,87 @@ class CentralBlockchain:
 
     # ------------------- Core helpers -------------------
     def _create_genesis_block(self) -> Block:
-        genesis = Block(index=0, timestamp=time(), data="Genesis Block", previous_hash="0"*64)
-        genesis.hash = genesis.compute_hash()
+        genesis = Block(index=0, timestamp=time_ns(), data="Genesis Block", previous_hash=bytes(32))
+        genesis.hash = genesis.compute_hash_bytes()
+        genesis.seal()
         return genesis
 
+    # The store is JSON Lines (one block per line) so appending a block is O(1) I/O.
     def _persist(self) -> None:
+        """Rewrite the whole store from the in-memory chain (atomically, via a temp file)."""
         if not self.persist_path:
             return
-        with open(self.persist_path, "w", encoding="utf-8") as f:
-            json.dump([asdict(b) for b in self.chain], f, indent=2)
+        tmp_path = self.persist_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.writelines(b.to_json() + b"\n" for b in self.chain)
+        os.replace(tmp_path, self.persist_path)
+
+    def _persist_one(self, block: Block) -> None:
+        """Append a single block to the store."""
+        if not self.persist_path:
+            return
+        with open(self.persist_path, "ab") as f:
+            f.write(block.to_json() + b"\n")
 
     def _load(self) -> None:
+        """
+        Load the store. A missing or empty file leaves the chain empty; an unparseable
+        last line without its newline (interrupted append) is dropped from the file; any
+        other damage, including a complete but corrupt line, raises
+        ValueError so an existing chain is never replaced by a fresh genesis block.
+        """
+        try:
+            with open(self.persist_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return
+        if raw.lstrip().startswith(b"["):
+            self._migrate_legacy(raw)
+            return
+
+        lines = raw.splitlines(keepends=True)
+        chain: List[Block] = []
+        kept = 0  # bytes of the file holding good blocks
+        for lineno, line in enumerate(lines, 1):
+            if line.strip():
+                try:
+                    chain.append(Block.from_dict(json.loads(line)))
+                except (ValueError, KeyError, TypeError) as e:
+                    # Appends write a block and its newline in one go, so only an
+                    # unterminated last line can be a torn write; anything else is damage.
+                    if line.endswith(b"\n"):
+                        raise ValueError(f"{self.persist_path}: unreadable block on line {lineno}") from e
+                    break
+            kept += len(line)
+
+        good = raw[:kept]
+        unterminated = bool(good) and not good.endswith(b"\n")
+        if kept < len(raw) or unterminated:
+            with open(self.persist_path, "r+b") as f:
+                f.truncate(kept)
+                if unterminated:  # so the next append starts on its own line
+                    f.seek(kept)
+                    f.write(b"\n")
+        for block in chain:
+            block.seal()
+        self.chain = chain
+
+    def _migrate_legacy(self, raw: bytes) -> None:
+        """Convert a store written by older versions (one JSON array) to JSON Lines."""
         try:
-            with open(self.persist_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            self.chain = [Block(**b) for b in raw]
-        except Exception:
-            self.chain = []
+            chain = [Block.from_dict(b) for b in json.loads(raw)]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"{self.persist_path}: unreadable legacy chain file") from e
+        with open(self.persist_path + ".bak", "wb") as f:
+            f.write(raw)
+        for block in chain:
+            block.seal()
+        self.chain = chain
+        self._persist()
+
+    def _meets_difficulty(self, digest: bytes) -> bool:
+        """Check a raw digest against the difficulty: its big-endian value must be below self.target."""
+        return digest <= self._max_digest
 
     # ------------------- Required API -------------------
     def setBlock(self, data: Any) -> Block:
@@ -104,15 +313,16 @@ class CentralBlockchain:
         prev = self.chain[-1]
         new_block = Block(
             index=prev.index + 1,
-            timestamp=time(),
+            timestamp=time_ns(),
             data=data,
             previous_hash=prev.hash,
             nonce=0,
-            hash=""
+            hash=b""
         )
         mined = self.mineBlock(new_block)
+        mined.seal()
         self.chain.append(mined)
-        self._persist()
+        self._persist_one(mined)
         return mined
 
     def getBlock(self, index: int) -> Optional[Block]:
@@ -123,38 +333,112 @@ class CentralBlockchain:
 
     def blocksExplorer(self) -> List[dict]:
         """Return the whole chain as serializable dicts (explorer-like)."""
-        return [asdict(b) for b in self.chain]
+        return [b.to_dict() for b in self.chain]
 
     def mineBlock(self, block: Block) -> Block:
         """
-        Proof-of-Work: find a nonce such that block.hash starts with '0' * difficulty.
+        Proof-of-Work: find the lowest nonce (from block.nonce up) whose digest is below
+        self.target, i.e. whose hex form has at least `difficulty` leading zeros.
         """
-        while True:
-            digest = block.compute_hash()
-            if digest.startswith(self.prefix):
-                block.hash = digest
-                return block
-            block.nonce += 1
+        head, tail = block._hash_parts()
+        if self.workers > 1:
+            block.nonce, digest = self._find_nonce_parallel(head, tail, block.nonce)
+        else:
+            for start in count(block.nonce, MINE_BATCH):
+                found = find_nonce(head, tail, start, start + MINE_BATCH, self._max_digest)
+                if found:
+                    block.nonce, digest = found
+                    break
+        block.hash = digest
+        return block
+
+    def _find_nonce_parallel(self, head: bytes, tail: bytes, start: int) -> Tuple[int, bytes]:
+        """
+        Search with a process pool: each round hands one batch to every worker and keeps
+        the first hit in nonce order, so the result matches the single-process search.
+        """
+        if self._pool is None:
+            # spawn, not fork: under --serve this runs inside a multithreaded Flask process.
+            self._pool = multiprocessing.get_context("spawn").Pool(self.workers)
+        round_size = self.workers * MINE_BATCH
+        for round_start in count(start, round_size):
+            batches = [(head, tail, s, s + MINE_BATCH, self._max_digest)
+                       for s in range(round_start, round_start + round_size, MINE_BATCH)]
+            for found in self._pool.starmap(find_nonce, batches):
+                if found:
+                    return found
+
+    def close(self) -> None:
+        """Stop the mining worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
 
     # ------------------- Validation (extra) -------------------
     def is_valid(self) -> bool:
         """
         Validate the entire chain.
         """
-        if not self.chain:
+        chain = self.chain
+        if not chain:
             return False
-        if self.chain[0].hash != self.chain[0].compute_hash():
+        # Check whole columns at once (cheap links first) instead of walking block by block.
+        hashes = [b.hash for b in chain]
+        if [b.previous_hash for b in chain[1:]] != hashes[:-1]:
             return False
-        for i in range(1, len(self.chain)):
-            prev = self.chain[i-1]
-            curr = self.chain[i]
-            if curr.previous_hash != prev.hash:
-                return False
-            if curr.compute_hash() != curr.hash:
-                return False
-            if not curr.hash.startswith(self.prefix):
-                return False
-        return True
+        if list(map(Block.compute_hash_bytes, chain)) != hashes:
+            return False
+        # The genesis block is not mined, so only the blocks after it must meet the difficulty.
+        return all(map(self._meets_difficulty, hashes[1:]))
+
+
+def create_app(bc: CentralBlockchain):
+    """Build the Flask app serving `bc` over HTTP (raises ImportError without Flask)."""
+    from flask import Flask, request
+
+    app = Flask(__name__)
+
+    def raw_json_response(body: Union[bytes, Iterator[bytes]], status: int = 200):
+        return app.response_class(body, status=status, mimetype="application/json")
+
+    def json_response(obj: Any, status: int = 200):
+        return raw_json_response(_dumps(obj), status)
+
+    @app.get("/")
+    def root():
+        return json_response({
+            "name": "Central Blockchain (educational)",
+            "difficulty": bc.difficulty,
+            "length": len(bc.chain),
+            "valid": bc.is_valid()
+        })
+
+    @app.get("/blocks")
+    def blocks():
+        # Stream the array one cached block at a time instead of building it in memory.
+        def stream():
+            yield b"["
+            for i, blk in enumerate(bc.chain):
+                yield b"," + blk.to_json() if i else blk.to_json()
+            yield b"]"
+        return raw_json_response(stream())
+
+    @app.get("/blocks/<int:index>")
+    def get_block(index: int):
+        blk = bc.getBlock(index)
+        if not blk:
+            return json_response({"error": "not found"}, 404)
+        return raw_json_response(blk.to_json())
+
+    @app.post("/blocks")
+    def add_block():
+        payload = request.get_json(force=True, silent=True) or {}
+        data = payload.get("data", "")
+        new_blk = bc.setBlock(data)
+        return raw_json_response(new_blk.to_json(), 201)
+
+    return app
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -166,30 +450,34 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--mine", type=str, help="Mine a block with this data (preview only, not appended).")
     p.add_argument("--serve", action="store_true", help="Run as centralized HTTP service (Flask).")
     p.add_argument("--port", type=int, default=5000, help="Port for the HTTP service.")
-    p.add_argument("--store", type=str, default="chain.json", help="Path to persist the chain.")
+    p.add_argument("--workers", type=int, default=1, help="Processes used for mining (0 = one per CPU).")
+    p.add_argument("--store", type=str, default="chain.jsonl", help="Path to persist the chain (JSON Lines).")
     return p
 
 
 def main():
     args = build_parser().parse_args()
-    bc = CentralBlockchain(difficulty=args.difficulty, persist_path=args.store)
+    try:
+        bc = CentralBlockchain(difficulty=args.difficulty, persist_path=args.store, workers=args.workers)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
 
     if args.mine and not args.add:
-        temp = Block(index=len(bc.chain), timestamp=time(), data=args.mine, previous_hash=bc.chain[-1].hash)
+        temp = Block(index=len(bc.chain), timestamp=time_ns(), data=args.mine, previous_hash=bc.chain[-1].hash)
         mined = bc.mineBlock(temp)
-        print(json.dumps(asdict(mined), indent=2))
+        print(json.dumps(mined.to_dict(), indent=2))
         return
 
     if args.add:
         b = bc.setBlock(args.add)
         print("Mined & appended block:")
-        print(json.dumps(asdict(b), indent=2))
+        print(json.dumps(b.to_dict(), indent=2))
         return
 
     if args.get is not None:
         b = bc.getBlock(args.get)
         if b:
-            print(json.dumps(asdict(b), indent=2))
+            print(json.dumps(b.to_dict(), indent=2))
         else:
             print(f"Block {args.get} not found.")
         return
@@ -200,40 +488,11 @@ def main():
 
     if args.serve:
         try:
-            from flask import Flask, request, jsonify
+            app = create_app(bc)
         except ImportError:
             print("Flask not installed. Run: pip install Flask")
             return
 
-        app = Flask(_name_)
-
-        @app.get("/")
-        def root():
-            return jsonify({
-                "name": "Central Blockchain (educational)",
-                "difficulty": bc.difficulty,
-                "length": len(bc.chain),
-                "valid": bc.is_valid()
-            })
-
-        @app.get("/blocks")
-        def blocks():
-            return jsonify(bc.blocksExplorer())
-
-        @app.get("/blocks/<int:index>")
-        def get_block(index: int):
-            blk = bc.getBlock(index)
-            if not blk:
-                return jsonify({"error": "not found"}), 404
-            return jsonify(asdict(blk))
-
-        @app.post("/blocks")
-        def add_block():
-            payload = request.get_json(force=True, silent=True) or {}
-            data = payload.get("data", "")
-            new_blk = bc.setBlock(data)
-            return jsonify(asdict(new_blk)), 201
-
         app.run(host="0.0.0.0", port=args.port, debug=False)
         return
 
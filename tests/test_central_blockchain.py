@@ -0,0 +1,162 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import central_blockchain  # noqa: E402
+from central_blockchain import Block, CentralBlockchain, create_app  # noqa: E402
+
+try:
+    import flask
+except ImportError:
+    flask = None
+
+
+class ChainTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = os.path.join(tmp.name, "chain.jsonl")
+
+    def make_chain(self, **kwargs):
+        kwargs.setdefault("difficulty", 1)
+        return CentralBlockchain(persist_path=self.store, **kwargs)
+
+
+class ExplorerTest(ChainTestCase):
+    def test_explorer_dicts_do_not_share_block_data(self):
+        bc = self.make_chain()
+        bc.setBlock({"x": [1]})
+        bc.blocksExplorer()[1]["data"]["x"].append(2)
+        self.assertEqual(bc.chain[1].data, {"x": [1]})
+        self.assertTrue(bc.is_valid())
+
+
+class StoreTest(ChainTestCase):
+    def read_lines(self):
+        with open(self.store, "rb") as f:
+            return f.read().splitlines()
+
+    def test_reload_keeps_chain(self):
+        bc = self.make_chain()
+        for i in range(3):
+            bc.setBlock(i)
+        reloaded = self.make_chain()
+        self.assertEqual(reloaded.blocksExplorer(), bc.blocksExplorer())
+        self.assertTrue(reloaded.is_valid())
+
+    def test_torn_last_line_is_dropped(self):
+        bc = self.make_chain()
+        for i in range(5):
+            bc.setBlock(i)
+        with open(self.store, "ab") as f:
+            f.write(b'{"index":6,"timest')
+        reloaded = self.make_chain()
+        self.assertEqual(len(reloaded.chain), 6)
+        self.assertTrue(reloaded.is_valid())
+        self.assertEqual(len(self.read_lines()), 6)
+        reloaded.setBlock("after")
+        self.assertEqual(len(self.make_chain().chain), 7)
+
+    def test_corrupt_complete_last_line_refuses_to_load(self):
+        bc = self.make_chain()
+        for i in range(3):
+            bc.setBlock(i)
+        with open(self.store, "ab") as f:
+            f.write(b'{"bad": 1}\n')
+        with open(self.store, "rb") as f:
+            before = f.read()
+        with self.assertRaises(ValueError):
+            self.make_chain()
+        with open(self.store, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+    def test_damaged_middle_line_refuses_to_load(self):
+        bc = self.make_chain()
+        for i in range(3):
+            bc.setBlock(i)
+        lines = self.read_lines()
+        lines[1] = b"garbage"
+        with open(self.store, "wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+        with self.assertRaises(ValueError):
+            self.make_chain()
+        self.assertEqual(self.read_lines(), lines)
+
+    def test_legacy_array_store_is_migrated(self):
+        bc = self.make_chain()
+        bc.setBlock("legacy")
+        legacy = json.dumps(bc.blocksExplorer(), indent=2).encode("utf-8")
+        with open(self.store, "wb") as f:
+            f.write(legacy)
+        migrated = self.make_chain()
+        self.assertEqual(migrated.blocksExplorer(), bc.blocksExplorer())
+        self.assertTrue(migrated.is_valid())
+        self.assertEqual(len(self.read_lines()), 2)
+        with open(self.store + ".bak", "rb") as f:
+            self.assertEqual(f.read(), legacy)
+
+
+class NonFiniteDataTest(ChainTestCase):
+    def check_round_trip(self):
+        bc = self.make_chain()
+        bc.setBlock(float("nan"))
+        bc.setBlock({"x": [float("inf"), 1.5]})
+        reloaded = self.make_chain()
+        self.assertEqual(len(reloaded.chain), 3)
+        self.assertTrue(reloaded.is_valid())
+
+    def test_non_finite_data_round_trips(self):
+        self.check_round_trip()
+
+    def test_non_finite_data_round_trips_without_orjson(self):
+        orig = central_blockchain.orjson
+        central_blockchain.orjson = None
+        self.addCleanup(setattr, central_blockchain, "orjson", orig)
+        self.check_round_trip()
+
+
+class WorkersTest(unittest.TestCase):
+    def test_negative_workers_rejected(self):
+        with self.assertRaises(ValueError):
+            CentralBlockchain(persist_path=None, workers=-3)
+
+    def test_parallel_mining_matches_serial(self):
+        serial = CentralBlockchain(difficulty=3, persist_path=None)
+        parallel = CentralBlockchain(difficulty=3, persist_path=None, workers=2)
+        self.addCleanup(parallel.close)
+        for data in ("a", "b"):
+            expected = serial.mineBlock(Block(1, 123, data, bytes(32)))
+            mined = parallel.mineBlock(Block(1, 123, data, bytes(32)))
+            self.assertEqual((mined.nonce, mined.hash), (expected.nonce, expected.hash))
+        pool = parallel._pool
+        parallel.mineBlock(Block(2, 123, "c", bytes(32)))
+        self.assertIs(parallel._pool, pool)
+
+
+@unittest.skipIf(flask is None, "Flask not installed")
+class HttpTest(ChainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bc = self.make_chain()
+        self.client = create_app(self.bc).test_client()
+
+    def test_add_and_list_blocks(self):
+        resp = self.client.post("/blocks", json={"data": {"x": [1]}})
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.get_json(), self.bc.chain[1].to_dict())
+
+        resp = self.client.get("/blocks")
+        self.assertEqual(resp.mimetype, "application/json")
+        self.assertEqual(json.loads(resp.get_data()), self.bc.blocksExplorer())
+
+        self.assertEqual(self.client.get("/blocks/1").get_json()["data"], {"x": [1]})
+        self.assertEqual(self.client.get("/blocks/9").status_code, 404)
+        self.assertTrue(self.client.get("/").get_json()["valid"])
+
+
+if __name__ == "__main__":
+    unittest.main()